@@ -2,6 +2,7 @@
 Extract Changelog category and Changelog entry from GitHub PR bodies.
 """
 
+import functools
 import re
 
 # Match "Changelog category (leave one):" with optional ### prefix
@@ -16,6 +17,14 @@ _ENTRY_PATTERN = re.compile(
     r"Changelog entry \(a\s+.+?\s+of the changes that goes (?:into|to) CHANGELOG\.md\):",
     re.IGNORECASE | re.DOTALL,
 )
+# Both headers in one alternation so the body is scanned once. DOTALL only
+# affects the entry part and MULTILINE only the category part (its ^).
+_SECTION_HEADER_PATTERN = re.compile(
+    f"(?P<category>{_CATEGORY_PATTERN.pattern})|(?P<entry>{_ENTRY_PATTERN.pattern})",
+    re.MULTILINE | re.IGNORECASE | re.DOTALL,
+)
+# A section ends before the next ### or ## header, or a --- separator
+_NEXT_SECTION_PATTERNS = [re.compile(p) for p in (r"\n### ", r"\n## ", r"\n\n---")]
 
 
 def _find_line_start(body: str, pos: int) -> int:
@@ -23,16 +32,40 @@ def _find_line_start(body: str, pos: int) -> int:
     return body.rfind("\n", 0, pos) + 1 if pos > 0 else 0
 
 
-def _find_section_end(body: str, after_pos: int, next_patterns: list[str]) -> int:
+def _find_section_end(body: str, after_pos: int, next_patterns: list[re.Pattern[str]]) -> int:
     """Find the end index of a section (before the next header or end of body)."""
     end = len(body)
     for pattern in next_patterns:
-        match = re.search(pattern, body[after_pos:])
+        match = pattern.search(body, after_pos)
         if match:
-            end = min(end, after_pos + match.start())
+            end = min(end, match.start())
     return end
 
 
+@functools.lru_cache(maxsize=128)
+def _find_sections(pr_body: str) -> tuple[tuple[int, int] | None, tuple[int, int] | None]:
+    """Return (start, end) spans of the category and entry sections, or None if absent."""
+    cat_span = entry_span = None
+    cat_match = entry_match = None
+    for match in _SECTION_HEADER_PATTERN.finditer(pr_body):
+        if match.lastgroup == "category":
+            cat_match = cat_match or match
+        else:
+            entry_match = entry_match or match
+            if cat_match is None:
+                # An entry header can wrap over lines and hide a category header from finditer
+                cat_match = _CATEGORY_PATTERN.search(pr_body, match.start(), match.end())
+        if cat_match and entry_match:
+            break
+    if cat_match:
+        start = _find_line_start(pr_body, cat_match.start())
+        cat_span = (start, _find_section_end(pr_body, cat_match.end(), _NEXT_SECTION_PATTERNS))
+    if entry_match:
+        start = _find_line_start(pr_body, entry_match.start())
+        entry_span = (start, _find_section_end(pr_body, entry_match.end(), _NEXT_SECTION_PATTERNS))
+    return cat_span, entry_span
+
+
 def make_changelog_description(
     pr_body: str | None,
     *,
@@ -50,40 +83,30 @@ def make_changelog_description(
         return ""
 
     parts: list[str] = []
-    next_section = [r"\n### ", r"\n## ", r"\n\n---"]
     entry_suffix = ""
     if pr_url and pr_author:
         entry_suffix = f" ({pr_url} by @{pr_author})"
 
+    cat_span, entry_span = _find_sections(pr_body)
+
     # Changelog category (leave one):
-    cat_match = _CATEGORY_PATTERN.search(pr_body)
-    if cat_match:
-        start = _find_line_start(pr_body, cat_match.start())
-        end = _find_section_end(pr_body, cat_match.end(), next_section)
+    if cat_span:
+        start, end = cat_span
         section = pr_body[start:end].strip()
         if section:
             parts.append(section)
 
     # Changelog entry (if present):
-    entry_match = _ENTRY_PATTERN.search(pr_body)
-    if entry_match:
-        start = _find_line_start(pr_body, entry_match.start())
-        end = _find_section_end(pr_body, entry_match.end(), next_section)
+    if entry_span:
+        start, end = entry_span
         section = pr_body[start:end].strip()
         # Take only the first non-empty line of content (skip blank lines after header; any newline is delimiter)
-        first_nl = section.find("\n")
-        if first_nl >= 0:
-            header_line = section[: first_nl + 1]
-            rest = section[first_nl + 1 :]
-            first_content_line = next((ln for ln in rest.split("\n") if ln.strip()), "").strip()
-            section = (header_line + first_content_line) if first_content_line else section
-        if section and entry_suffix:
-            # Append suffix to the entry content (after the header line)
-            first_nl = section.find("\n")
-            if first_nl >= 0:
-                header = section[: first_nl + 1]
-                content = section[first_nl + 1 :].rstrip()
-                section = header + content + entry_suffix
+        # and append the suffix to it; split once instead of rescanning for newlines
+        lines = section.split("\n")
+        if len(lines) > 1:
+            first_content_line = next((ln for ln in lines[1:] if ln.strip()), "").strip()
+            if first_content_line:
+                section = f"{lines[0]}\n{first_content_line}{entry_suffix}"
         if section:
             parts.append(section)
 
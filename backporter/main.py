@@ -17,11 +17,16 @@ import shutil
 import subprocess
 import sys
 import tempfile
-
-from github import Github
+from collections.abc import Callable
+from typing import TYPE_CHECKING, NamedTuple
 
 from backporter.changelog_extract import make_changelog_description
 
+# PyGithub, requests and concurrent.futures are imported where they are used:
+# they pull in import trees that --help and --conflicts-resolved never need
+if TYPE_CHECKING:
+    from concurrent.futures import ThreadPoolExecutor
+
 
 def run(cmd: list[str], cwd: str | None = None, check: bool = True) -> subprocess.CompletedProcess:
     """Run a command and return the result."""
@@ -37,7 +42,34 @@ def run_no_check(cmd: list[str], cwd: str | None = None) -> subprocess.Completed
     return subprocess.run(cmd, cwd=cwd, capture_output=True, text=True)
 
 
-# Git status --porcelain: first two chars = index + work tree; unmerged codes:
+def run_streaming(
+    cmd: list[str], cwd: str | None = None, check: bool = True, env: dict[str, str] | None = None
+) -> subprocess.CompletedProcess:
+    """Run a long-running command with its output going straight to the terminal (not buffered)."""
+    # Flush our own output first so it stays in order with the child's
+    sys.stdout.flush()
+    sys.stderr.flush()
+    proc = subprocess.Popen(cmd, cwd=cwd, env=env)
+    returncode = proc.wait()
+    if check and returncode != 0:
+        raise RuntimeError(f"Command failed: {' '.join(cmd)}")
+    return subprocess.CompletedProcess(cmd, returncode)
+
+
+def _submit(executor: "ThreadPoolExecutor | None", fn: Callable, *args) -> Callable[[], object]:
+    """Run fn(*args) on the executor, or right away when running serially (--jobs 1).
+
+    Returns a callable that waits for and returns the result. In serial mode
+    exceptions propagate immediately, so later steps never start.
+    """
+    if executor is not None:
+        return executor.submit(fn, *args).result
+    result = fn(*args)
+    return lambda: result
+
+
+# Git status --porcelain=v2: unmerged ("u") records carry the XY code in field 2;
+# unmerged codes:
 # UU = both modified, DU = deleted by us/updated by them, UD = updated by us/deleted by them,
 # DD = both deleted, AA = both added
 _CONFLICT_TYPE_LABELS = {
@@ -56,20 +88,27 @@ def get_conflicted_files(cwd: str) -> list[str]:
 
 def get_conflicted_entries(cwd: str) -> list[tuple[str, str]]:
     """Return list of (path, conflict_type_label) for unmerged paths."""
+    # Untracked files can never be unmerged, so skip the untracked-files walk
     result = subprocess.run(
-        ["git", "status", "--porcelain", "-u"],
+        ["git", "status", "--porcelain=v2", "-z", "--untracked-files=no"],
         cwd=cwd, capture_output=True, text=True
     )
     if result.returncode != 0:
         return []
     entries: list[tuple[str, str]] = []
-    for line in result.stdout.strip().splitlines():
-        if len(line) < 4:
+    records = iter(result.stdout.split("\0"))
+    for record in records:
+        if record.startswith("2 "):
+            # Rename/copy records are followed by the original path as a separate field
+            next(records, None)
+            continue
+        if not record.startswith("u "):
             continue
-        code = line[:2]
-        rest = line[3:].strip()
-        # Handle "old -> new" renames
-        path = rest.split(" -> ")[-1].strip() if " -> " in rest else rest
+        # u <XY> <sub> <m1> <m2> <m3> <mW> <h1> <h2> <h3> <path>
+        fields = record.split(" ", 10)
+        if len(fields) < 11:
+            continue
+        code, path = fields[1], fields[10]
         if code in _CONFLICT_TYPE_LABELS:
             label = _CONFLICT_TYPE_LABELS[code]
             entries.append((path, label))
@@ -88,30 +127,81 @@ def branch_exists(cwd: str, branch: str) -> bool:
     return result.returncode == 0
 
 
+def get_branch_worktree(cwd: str, branch: str) -> str | None:
+    """Return the path of the worktree that has the given local branch checked out, if any."""
+    result = run_no_check(["git", "worktree", "list", "--porcelain"], cwd=cwd)
+    path = None
+    for line in result.stdout.splitlines():
+        if line.startswith("worktree "):
+            path = line[len("worktree "):]
+        elif line == f"branch refs/heads/{branch}":
+            return path
+    return None
+
+
+def get_main_worktree(cwd: str) -> str | None:
+    """Return the path of the repository's main worktree (listed first by git)."""
+    result = run_no_check(["git", "worktree", "list", "--porcelain"], cwd=cwd)
+    first = result.stdout.split("\n", 1)[0]
+    if result.returncode != 0 or not first.startswith("worktree "):
+        return None
+    return first[len("worktree "):]
+
+
+def remove_worktree(repo_dir: str, wt_dir: str) -> None:
+    """Remove a backport worktree, and its <repo>-backports parent once that is empty."""
+    run(["git", "worktree", "remove", wt_dir], cwd=repo_dir)
+    try:
+        os.rmdir(os.path.dirname(wt_dir))
+    except OSError:
+        # Other backport worktrees are still there
+        pass
+
+
 def is_unresolved_state(stderr: str) -> bool:
     """Return True if git stderr indicates unresolved conflicts or index state."""
     s = (stderr or "").lower()
-    return "resolve" in s or "unmerged" in s or "index" in s
+    # git switch refuses outright while a cherry-pick/merge is in progress
+    return "resolve" in s or "unmerged" in s or "index" in s or "cannot switch branch" in s
 
 
-def is_cherry_pick_in_progress(cwd: str) -> bool:
-    """Return True if a cherry-pick is in progress (e.g. after resolving conflicts)."""
-    result = run_no_check(
-        ["git", "rev-parse", "-q", "--verify", "CHERRY_PICK_HEAD"],
-        cwd=cwd,
-    )
-    return result.returncode == 0
+class GitState(NamedTuple):
+    """Repository state needed to finish a backport after resolving conflicts."""
+
+    in_cherry_pick: bool
+    current_branch: str
 
 
-def get_current_branch(cwd: str) -> str:
-    """Return the current branch name."""
+def _git_state(cwd: str) -> GitState:
+    """Return whether a cherry-pick is in progress and the current branch, in one git call."""
+    # --git-path resolves the (per-worktree) CHERRY_PICK_HEAD location without
+    # failing when it does not exist; its presence is then checked on disk
     result = subprocess.run(
-        ["git", "branch", "--show-current"],
+        ["git", "rev-parse", "--abbrev-ref", "HEAD", "--git-path", "CHERRY_PICK_HEAD"],
         cwd=cwd, capture_output=True, text=True
     )
-    if result.returncode != 0 or not result.stdout.strip():
+    lines = result.stdout.splitlines()
+    if result.returncode != 0 or len(lines) != 2:
+        raise RuntimeError("Could not determine repository state")
+    branch, cherry_pick_head = lines
+    if not branch or branch == "HEAD":
         raise RuntimeError("Could not determine current branch")
-    return result.stdout.strip()
+    return GitState(
+        in_cherry_pick=os.path.exists(os.path.join(cwd, cherry_pick_head)),
+        current_branch=branch,
+    )
+
+
+def remove_dir(path: str) -> None:
+    """Delete a directory tree (e.g. the temporary clone), ignoring errors."""
+    if os.name == "posix":
+        # rm -rf is considerably faster than shutil.rmtree on clones with many files
+        try:
+            subprocess.run(["rm", "-rf", path], capture_output=True)
+            return
+        except OSError:
+            pass
+    shutil.rmtree(path, ignore_errors=True)
 
 
 def prompt_yes_no(question: str, default_no: bool = True) -> bool:
@@ -126,6 +216,10 @@ def prompt_yes_no(question: str, default_no: bool = True) -> bool:
     return answer in ("y", "yes")
 
 
+# Match: https://github.com/owner/repo/pull/123 or github.com/owner/repo/pull/123
+_PR_URL_RE = re.compile(r"github\.com/([^/]+)/([^/]+)/pull/(\d+)")
+
+
 def parse_target(target: str) -> tuple[str, str]:
     """Parse 'owner/repo:branch' into (owner/repo, branch)."""
     if ":" not in target:
@@ -138,26 +232,103 @@ def parse_target(target: str) -> tuple[str, str]:
 
 def parse_pr_url(url: str) -> tuple[str, int]:
     """Parse PR URL into (owner/repo, pr_number)."""
-    # Match: https://github.com/owner/repo/pull/123 or github.com/owner/repo/pull/123
-    match = re.search(r"github\.com/([^/]+)/([^/]+)/pull/(\d+)", url)
+    match = _PR_URL_RE.search(url)
     if not match:
         raise ValueError(f"Invalid PR URL: {url}")
     owner, repo, pr_num = match.groups()
     return f"{owner}/{repo}", int(pr_num)
 
 
-def get_merge_commit_sha(pr_repo: str, pr_number: int, token: str | None) -> str:
-    """Get the merge commit SHA for a PR via GitHub API."""
-    gh = Github(token) if token else Github()
-    repo = gh.get_repo(pr_repo)
-    pr = repo.get_pull(pr_number)
+_GRAPHQL_URL = "https://api.github.com/graphql"
+
+
+_PR_INFO_QUERY = """
+query($owner: String!, $name: String!, $number: Int!) {
+  repository(owner: $owner, name: $name) {
+    pullRequest(number: $number) {
+      merged
+      mergeCommit { oid }
+      body
+      url
+      author { login }
+    }
+  }
+}
+"""
+
+
+class PRInfo(NamedTuple):
+    """The PR fields backporter needs: merge state, merge commit, body and author."""
+
+    number: int
+    merged: bool
+    merge_sha: str | None
+    body: str | None
+    url: str
+    author: str | None
+
+
+def _fetch_pr_info(pr_repo: str, pr_number: int, token: str) -> PRInfo:
+    """Fetch PR info with a single GraphQL request (requires a token)."""
+    import requests
+
+    owner, name = pr_repo.split("/", 1)
+    response = requests.post(
+        _GRAPHQL_URL,
+        json={
+            "query": _PR_INFO_QUERY,
+            "variables": {"owner": owner, "name": name, "number": pr_number},
+        },
+        headers={"Authorization": f"bearer {token}"},
+        timeout=30,
+    )
+    if response.status_code != 200:
+        raise RuntimeError(f"GitHub GraphQL request failed: HTTP {response.status_code}")
+    payload = response.json()
+    if payload.get("errors"):
+        messages = "; ".join(err.get("message", "") for err in payload["errors"])
+        raise RuntimeError(f"GitHub GraphQL request failed: {messages}")
+    pr = payload["data"]["repository"]["pullRequest"]
+    return PRInfo(
+        number=pr_number,
+        merged=pr["merged"],
+        merge_sha=pr["mergeCommit"]["oid"] if pr["mergeCommit"] else None,
+        body=pr["body"],
+        url=pr["url"],
+        author=pr["author"]["login"] if pr["author"] else None,
+    )
+
+
+def _load_pr(pr_repo: str, pr_number: int, token: str | None) -> PRInfo:
+    """Fetch the PR info needed for the backport and the changelog description.
+
+    Uses a single GraphQL request when a token is available (GraphQL requires
+    authentication), otherwise falls back to the REST API via PyGithub.
+    """
+    if token:
+        return _fetch_pr_info(pr_repo, pr_number, token)
+    from github import Github
+
+    # lazy: get_repo() does not fetch the repository, so get_pull() is the only request
+    pr = Github(lazy=True).get_repo(pr_repo).get_pull(pr_number)
+    return PRInfo(
+        number=pr_number,
+        merged=pr.merged,
+        merge_sha=pr.merge_commit_sha,
+        body=pr.body,
+        url=pr.html_url,
+        author=pr.user.login if pr.user else None,
+    )
+
 
+def get_merge_commit_sha(pr: PRInfo) -> str:
+    """Return the merge commit SHA of a loaded PR, failing if it cannot be backported."""
     if not pr.merged:
-        raise RuntimeError(f"PR #{pr_number} is not merged yet")
+        raise RuntimeError(f"PR #{pr.number} is not merged yet")
 
-    merge_sha = pr.merge_commit_sha
+    merge_sha = pr.merge_sha
     if not merge_sha:
-        raise RuntimeError(f"PR #{pr_number} has no merge commit (merge strategy may not support backporting)")
+        raise RuntimeError(f"PR #{pr.number} has no merge commit (merge strategy may not support backporting)")
 
     return merge_sha
 
@@ -191,26 +362,57 @@ def main() -> None:
         dest="repo_dir",
         help="Use existing repo directory instead of cloning",
     )
+    parser.add_argument(
+        "--worktree",
+        action="store_true",
+        help="With -C, build the backport in a separate git worktree next to the repo "
+             "instead of switching branches in it",
+    )
     parser.add_argument(
         "--work-dir",
         help="Directory to clone into when not using -C (default: temp dir)",
     )
+    parser.add_argument(
+        "--clone-depth",
+        type=int,
+        default=50,
+        help="History depth of the fresh clone when not using -C; 0 for full history (default: 50)",
+    )
     parser.add_argument(
         "--token",
         default=os.environ.get("GITHUB_TOKEN"),
         help="GitHub token for API access (default: GITHUB_TOKEN env var)",
     )
+    parser.add_argument(
+        "-j", "--jobs",
+        type=int,
+        default=1,
+        help="Run independent network steps (GitHub API, git fetch) concurrently "
+             "with up to N threads (default: 1, serial)",
+    )
     args = parser.parse_args()
+    if args.jobs < 1:
+        parser.error("--jobs must be at least 1")
+    if args.clone_depth < 0:
+        parser.error("--clone-depth must not be negative")
+    if args.worktree and not args.repo_dir:
+        parser.error("--worktree requires -C")
 
     if args.conflicts_resolved:
         if not args.repo_dir or not args.target:
             parser.error("--conflicts-resolved requires -C and -t")
         target_repo, _ = parse_target(args.target)
         repo_dir = os.path.abspath(args.repo_dir)
-        if not os.path.isdir(os.path.join(repo_dir, ".git")):
+        # .git is a file (not a directory) in linked worktrees, e.g. one made by --worktree
+        if not os.path.exists(os.path.join(repo_dir, ".git")):
             print(f"Error: {repo_dir} is not a git repository", file=sys.stderr)
             sys.exit(1)
-        if not is_cherry_pick_in_progress(repo_dir):
+        try:
+            state = _git_state(repo_dir)
+        except RuntimeError as e:
+            print(f"Error: {e}", file=sys.stderr)
+            sys.exit(1)
+        if not state.in_cherry_pick:
             print("Error: no cherry-pick in progress (CHERRY_PICK_HEAD not found).", file=sys.stderr)
             sys.exit(1)
         print("Staging all changes...")
@@ -218,16 +420,22 @@ def main() -> None:
         print("Continuing cherry-pick...")
         env = os.environ.copy()
         env["GIT_EDITOR"] = "true"
-        result = subprocess.run(
-            ["git", "cherry-pick", "--continue"],
-            cwd=repo_dir, env=env, capture_output=True, text=True,
-        )
+        result = run_streaming(["git", "cherry-pick", "--continue"], cwd=repo_dir, check=False, env=env)
         if result.returncode != 0:
-            print(result.stderr or result.stdout, file=sys.stderr)
             sys.exit(1)
-        current_branch = get_current_branch(repo_dir)
+        current_branch = state.current_branch
         print(f"Pushing {current_branch} to {target_repo}...")
-        run(["git", "push", "origin", current_branch], cwd=repo_dir)
+        try:
+            run_streaming(["git", "push", "origin", current_branch], cwd=repo_dir)
+            # A worktree made by --worktree (<repo>-backports/...) is done with now
+            main_repo = get_main_worktree(repo_dir)
+            if main_repo and os.path.realpath(os.path.dirname(repo_dir)) == os.path.realpath(
+                f"{main_repo}-backports"
+            ):
+                remove_worktree(main_repo, repo_dir)
+        except RuntimeError as e:
+            print(f"Error: {e}", file=sys.stderr)
+            sys.exit(1)
         print(f"\nDone! Branch {current_branch} has been pushed to {target_repo}.")
         sys.exit(0)
 
@@ -240,13 +448,11 @@ def main() -> None:
 
     # --make-description only: fetch PR body, output changelog description, exit
     if args.make_description and not args.target:
-        gh = Github(args.token) if args.token else Github()
-        repo = gh.get_repo(pr_repo)
-        pr = repo.get_pull(pr_number)
+        pr = _load_pr(pr_repo, pr_number, args.token)
         description = make_changelog_description(
             pr.body,
-            pr_url=pr.html_url,
-            pr_author=pr.user.login if pr.user else None,
+            pr_url=pr.url,
+            pr_author=pr.author,
         )
         print(description)
         return
@@ -254,118 +460,178 @@ def main() -> None:
     target_repo, target_branch = parse_target(args.target)
 
     backport_branch = f"backports/{target_branch}/{pr_number}"
+    # Remote-tracking ref the backport branch starts from; fetched explicitly so the
+    # start point never depends on FETCH_HEAD (the merge commit fetch overwrites it)
+    target_ref = f"refs/remotes/origin/{target_branch}"
     clone_url = f"https://github.com/{target_repo}.git"
     pr_fetch_url = f"https://github.com/{pr_repo}.git"
 
-    # Get merge commit SHA via GitHub API
-    print(f"Fetching PR #{pr_number} merge commit SHA...")
-    merge_sha = get_merge_commit_sha(pr_repo, pr_number, args.token)
-
     if args.repo_dir:
         repo_dir = os.path.abspath(args.repo_dir)
-        if not os.path.isdir(os.path.join(repo_dir, ".git")):
+        # .git is a file (not a directory) in linked worktrees
+        if not os.path.exists(os.path.join(repo_dir, ".git")):
             print(f"Error: {repo_dir} is not a git repository", file=sys.stderr)
             sys.exit(1)
         cleanup_work_dir = False
+        # With --worktree, e.g. <repo>-backports/main-42 next to the repo
+        wt_dir = os.path.join(f"{repo_dir}-backports", f"{target_branch.replace('/', '-')}-{pr_number}")
     else:
         work_dir = args.work_dir or tempfile.mkdtemp(prefix="backporter-")
         repo_dir = os.path.join(work_dir, "repo")
         cleanup_work_dir = not args.work_dir
 
-    def _print_description_and_exit(exit_code: int = 0) -> None:
-        if args.make_description:
-            gh = Github(args.token) if args.token else Github()
-            repo_obj = gh.get_repo(pr_repo)
-            pr = repo_obj.get_pull(pr_number)
+    # The PR is fetched once; the description printers below share it
+    pr: PRInfo | None = None
+
+    def _print_description() -> None:
+        if args.make_description and pr is not None:
             description = make_changelog_description(
                 pr.body,
-                pr_url=pr.html_url,
-                pr_author=pr.user.login if pr.user else None,
+                pr_url=pr.url,
+                pr_author=pr.author,
             )
             if description:
                 print("\n--- Changelog description ---\n")
                 print(description)
+
+    def _print_description_and_exit(exit_code: int = 0) -> None:
+        _print_description()
         sys.exit(exit_code)
 
+    def _load_backport_pr() -> tuple[PRInfo, str]:
+        loaded = _load_pr(pr_repo, pr_number, args.token)
+        return loaded, get_merge_commit_sha(loaded)
+
+    # With --jobs > 1, the GitHub API call overlaps the initial fetch/clone and
+    # the merge commit fetch overlaps creating the backport branch
+    executor = None
+    if args.jobs > 1:
+        from concurrent.futures import ThreadPoolExecutor
+
+        executor = ThreadPoolExecutor(max_workers=args.jobs)
+
     try:
+        # Get merge commit SHA via GitHub API; serially, an unmerged PR fails
+        # here before git is touched
+        print(f"Fetching PR #{pr_number} merge commit SHA...")
+        wait_pr = _submit(executor, _load_backport_pr)
+
         if args.repo_dir:
-            # Use existing repo: fetch and checkout target branch
+            # Use existing repo: fetch the target branch (the local target branch is left as is)
             print(f"Fetching latest from {target_repo}...")
-            run(["git", "fetch", "origin", target_branch], cwd=repo_dir)
-            co_result = run_no_check(["git", "checkout", target_branch], cwd=repo_dir)
-            if co_result.returncode != 0 and is_unresolved_state(co_result.stderr):
-                print(co_result.stderr, file=sys.stderr)
-                if not prompt_yes_no(
-                    "Unresolved conflicts or dirty state. Recreate backport branch from clean target?"
-                ):
-                    print("Leaving repo as is.", file=sys.stderr)
-                    _print_description_and_exit(0)
-                run_no_check(["git", "cherry-pick", "--abort"], cwd=repo_dir)
-                run(["git", "checkout", target_branch], cwd=repo_dir)
-                run(["git", "pull", "origin", target_branch], cwd=repo_dir)
-                run(["git", "branch", "-D", backport_branch], cwd=repo_dir)
-            else:
-                if co_result.returncode != 0:
-                    print(co_result.stderr, file=sys.stderr)
-                    raise RuntimeError(f"Command failed: git checkout {target_branch}")
-                run(["git", "pull", "origin", target_branch], cwd=repo_dir)
+            fetch_cmd = ["git", "fetch", "origin", f"+refs/heads/{target_branch}:{target_ref}"]
+            wait_fetch = _submit(executor, run_streaming, fetch_cmd, repo_dir)
         else:
-            # Clone the target repo
+            # Clone the target repo: blobless and shallow, so only the checkout's
+            # files are downloaded, not older file contents or history beyond --clone-depth
             print(f"Cloning {target_repo}...")
-            run(["git", "clone", "--branch", target_branch, clone_url, repo_dir])
-
-        # If backport branch already exists, prompt
-        if branch_exists(repo_dir, backport_branch):
+            clone_cmd = ["git", "clone", "--filter=blob:none", "--no-tags", "--single-branch"]
+            if args.clone_depth:
+                clone_cmd += ["--depth", str(args.clone_depth)]
+            clone_cmd += ["--branch", target_branch, clone_url, repo_dir]
+            wait_fetch = _submit(executor, run_streaming, clone_cmd)
+
+        pr, merge_sha = wait_pr()
+        wait_fetch()
+
+        # If backport branch already exists, prompt (a fresh clone has no such branch)
+        recreate = False
+        if args.repo_dir and branch_exists(repo_dir, backport_branch):
             if not prompt_yes_no(
                 f"Branch '{backport_branch}' already exists. Delete and recreate from clean target?"
             ):
                 print("Aborted.", file=sys.stderr)
                 _print_description_and_exit(0)
-            run(["git", "branch", "-D", backport_branch], cwd=repo_dir)
-
-        # Create the backport branch (checkout -b)
-        print(f"Creating branch {backport_branch}...")
-        run(["git", "checkout", "-b", backport_branch], cwd=repo_dir)
-
-        # Fetch and cherry-pick the PR merge commit
-        # Base repo (where PR was merged) is upstream of the target fork
-        if target_repo == pr_repo:
-            run(["git", "fetch", "origin", merge_sha], cwd=repo_dir)
-        else:
-            # Add upstream remote (or update URL if it exists)
-            result = subprocess.run(
-                ["git", "remote", "add", "upstream", pr_fetch_url],
-                cwd=repo_dir, capture_output=True, text=True
+            recreate = True
+
+        # The fresh clone is partial (and shallow unless --clone-depth 0), so fetch
+        # the merge commit the same way; git marks upstream as a promisor remote
+        merge_fetch_opts: list[str] = []
+        if not args.repo_dir:
+            merge_fetch_opts.append("--filter=blob:none")
+            if args.clone_depth:
+                # The merge commit and its first parent are all cherry-pick -m 1 needs
+                merge_fetch_opts.append("--depth=2")
+
+        def _fetch_merge_commit() -> None:
+            # An existing repo may already have the commit (e.g. a retried or earlier
+            # backport); cherry-pick -m 1 also needs its first parent. Probing a fresh
+            # partial clone is pointless and could trigger a lazy fetch instead.
+            if args.repo_dir:
+                probe = run_no_check(["git", "cat-file", "-e", f"{merge_sha}^1^{{commit}}"], cwd=repo_dir)
+                if probe.returncode == 0:
+                    return
+            # Base repo (where PR was merged) is upstream of the target fork
+            if target_repo == pr_repo:
+                run_streaming(["git", "fetch", *merge_fetch_opts, "origin", merge_sha], cwd=repo_dir)
+            else:
+                # Add upstream remote (or update URL if it exists)
+                result = subprocess.run(
+                    ["git", "remote", "add", "upstream", pr_fetch_url],
+                    cwd=repo_dir, capture_output=True, text=True
+                )
+                if result.returncode != 0 and "already exists" in result.stderr:
+                    run(["git", "remote", "set-url", "upstream", pr_fetch_url], cwd=repo_dir)
+                print(f"Fetching from upstream ({pr_repo})...")
+                run_streaming(["git", "fetch", *merge_fetch_opts, "upstream", merge_sha], cwd=repo_dir)
+
+        # Fetch the PR merge commit while the backport branch is created
+        wait_merge_fetch = _submit(executor, _fetch_merge_commit)
+
+        # Directory where the backport branch is checked out and cherry-picked
+        work_repo = repo_dir
+        if args.worktree:
+            # Create (or reset) the backport branch in its own worktree; the main
+            # checkout is left untouched
+            if recreate:
+                # git refuses to check out a branch that another checkout has, e.g. the
+                # main checkout after a run without --worktree
+                checked_out = get_branch_worktree(repo_dir, backport_branch)
+                if checked_out and os.path.realpath(checked_out) != os.path.realpath(wt_dir):
+                    raise RuntimeError(
+                        f"Branch {backport_branch} is checked out in {checked_out}; "
+                        "switch that checkout to another branch or run without --worktree"
+                    )
+                # Drop the worktree left by a previous run (e.g. with conflicts)
+                run_no_check(["git", "worktree", "remove", "--force", wt_dir], cwd=repo_dir)
+                run_no_check(["git", "worktree", "prune"], cwd=repo_dir)
+            print(f"Creating branch {backport_branch} in worktree {wt_dir}...")
+            run(
+                ["git", "worktree", "add", "--no-track", "-B", backport_branch, wt_dir, target_ref],
+                cwd=repo_dir,
             )
-            if result.returncode != 0 and "already exists" in result.stderr:
-                run(["git", "remote", "set-url", "upstream", pr_fetch_url], cwd=repo_dir)
-            print(f"Fetching from upstream ({pr_repo})...")
-            run(["git", "fetch", "upstream", merge_sha], cwd=repo_dir)
+            work_repo = wt_dir
+        else:
+            # Create (or reset) the backport branch at the fetched target branch
+            print(f"Creating branch {backport_branch}...")
+            switch_cmd = ["git", "switch", "--no-track", "-C", backport_branch, target_ref]
+            sw_result = run_no_check(switch_cmd, cwd=repo_dir)
+            if sw_result.returncode != 0 and is_unresolved_state(sw_result.stderr):
+                print(sw_result.stderr, file=sys.stderr)
+                if not recreate and not prompt_yes_no(
+                    "Unresolved conflicts or dirty state. Recreate backport branch from clean target?"
+                ):
+                    print("Leaving repo as is.", file=sys.stderr)
+                    _print_description_and_exit(0)
+                run_no_check(["git", "cherry-pick", "--abort"], cwd=repo_dir)
+                sw_result = run_no_check(switch_cmd, cwd=repo_dir)
+            if sw_result.returncode != 0:
+                print(sw_result.stderr, file=sys.stderr)
+                raise RuntimeError(f"Command failed: {' '.join(switch_cmd)}")
+
+        wait_merge_fetch()
 
+        # Cherry-pick the PR merge commit
         print("Cherry-picking merge commit...")
-        cp_result = run_no_check(
+        cp_result = run_streaming(
             ["git", "cherry-pick", "-m", "1", merge_sha, "--no-edit"],
-            cwd=repo_dir,
+            cwd=work_repo,
+            check=False,
         )
 
-        def _print_description() -> None:
-            if args.make_description:
-                gh = Github(args.token) if args.token else Github()
-                repo_obj = gh.get_repo(pr_repo)
-                pr = repo_obj.get_pull(pr_number)
-                description = make_changelog_description(
-                    pr.body,
-                    pr_url=pr.html_url,
-                    pr_author=pr.user.login if pr.user else None,
-                )
-                if description:
-                    print("\n--- Changelog description ---\n")
-                    print(description)
-
         if cp_result.returncode != 0:
-            # Cherry-pick failed; may be conflicts
-            print(cp_result.stderr, file=sys.stderr)
-            conflicted = get_conflicted_entries(repo_dir)
+            # Cherry-pick failed (git already printed why); may be conflicts
+            conflicted = get_conflicted_entries(work_repo)
             if conflicted:
                 print(
                     f"\nConflicts in {len(conflicted)} file(s); branch left with conflicts for manual resolve:",
@@ -373,12 +639,15 @@ def main() -> None:
                 )
                 for path, kind in conflicted:
                     print(f"  {path}  ({kind})", file=sys.stderr)
+                if args.worktree:
+                    print(f"\nWorktree with conflicts: {work_repo}", file=sys.stderr)
                 print(
                     "\nResolve conflicts, then run: git add <paths> && git cherry-pick --continue",
                     file=sys.stderr,
                 )
+                resume_dir = work_repo if args.worktree else "<repo-dir>"
                 print(
-                    "Or after resolving: backporter --conflicts-resolved -C <repo-dir> -t <target>",
+                    f"Or after resolving: backporter --conflicts-resolved -C {resume_dir} -t <target>",
                     file=sys.stderr,
                 )
                 _print_description()
@@ -389,7 +658,24 @@ def main() -> None:
 
         # Push to target repo
         print(f"Pushing {backport_branch} to {target_repo}...")
-        run(["git", "push", "origin", backport_branch], cwd=repo_dir)
+        push_cmd = ["git", "push", "origin", backport_branch]
+        if args.repo_dir and not args.worktree and not args.make_description:
+            # Nothing left to do after the push (no clone or worktree to remove, no
+            # description to print): replace this process with git, whose own output
+            # reports the result
+            if executor is not None:
+                executor.shutdown()
+            sys.stdout.flush()
+            sys.stderr.flush()
+            os.chdir(work_repo)
+            try:
+                os.execvp(push_cmd[0], push_cmd)
+            except OSError as e:
+                # e.g. git not on PATH; only returns on failure
+                raise RuntimeError(f"Could not run {' '.join(push_cmd)}: {e}") from e
+        run_streaming(push_cmd, cwd=work_repo)
+        if args.worktree:
+            remove_worktree(repo_dir, work_repo)
 
         print(f"\nDone! Branch {backport_branch} has been pushed to {target_repo}.")
         _print_description()
@@ -398,5 +684,7 @@ def main() -> None:
         print(f"Error: {e}", file=sys.stderr)
         sys.exit(1)
     finally:
+        if executor is not None:
+            executor.shutdown()
         if cleanup_work_dir:
-            shutil.rmtree(work_dir, ignore_errors=True)
+            remove_dir(work_dir)